@@ -1,9 +1,12 @@
 import tkinter as tk
-from tkinter import messagebox, simpledialog
+from tkinter import messagebox, simpledialog, filedialog
 from tkinter import ttk
+import csv
 import heapq
-import matplotlib.pyplot as plt
-import networkx as nx
+import itertools
+import sys
+import time
+from collections import deque
 
 class Passenger:
     def __init__(self, name, age, phone, source_station, destination_station):
@@ -21,16 +24,15 @@ class ListNode:
 class LinkedList:
     def __init__(self):
         self.head = None
+        self.tail = None
 
     def add_passenger(self, passenger):
         new_node = ListNode(passenger)
         if not self.head:
             self.head = new_node
         else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
+        self.tail = new_node
 
     def find_passenger(self, passenger_name):
         current = self.head
@@ -42,14 +44,14 @@ class LinkedList:
 
 class Queue:
     def __init__(self):
-        self.items = []
+        self.items = deque()
 
     def enqueue(self, item):
         self.items.append(item)
 
     def dequeue(self):
         if not self.is_empty():
-            return self.items.pop(0)
+            return self.items.popleft()
         return None
 
     def is_empty(self):
@@ -136,8 +138,9 @@ def get_shortest_time(graph, source, destination):
     total_time = (len(shortest_path) - 1) * 5
     return f"TIME FROM {source_name} TO {destination_name} IS {total_time} MINUTES"
 
-def get_shortest_path_distance(graph, source, destination):
-    distances = dijkstra(graph, source)
+def get_shortest_path_distance(graph, source, destination, distances=None):
+    if distances is None:
+        distances = dijkstra(graph, source)
     path = [destination]
     current_vertex = destination
 
@@ -146,6 +149,7 @@ def get_shortest_path_distance(graph, source, destination):
             if distances[current_vertex] == distances[neighbor] + weight:
                 path.append(neighbor)
                 current_vertex = neighbor
+                break
 
     return path[::-1]
 
@@ -166,33 +170,37 @@ def is_valid_station(graph, input_value, input_type):
     if input_type == "code":
         return get_station_name(input_value) in graph.vertices
     return False
+STATION_CODES = {
+    "CH": "Charminar",
+    "PJ": "Panjagutta",
+    "MH": "Mehdipatnam",
+    "ER": "Erragada",
+    "OU": "Osmaina University",
+    "JH": "Jubliee Hills",
+    "BL": "Balapur",
+    "GF": "Golconda Fort",
+    "LB": "LB Nagar",
+    "MK": "Manikonda",
+    "AL": "Alwal",
+    "BH": "Banjara Hills",
+    "AM": "Ameerpet",
+    "SA": "Shamshabad",
+    "AT": "Attapur",
+    "NA": "Narsingi",
+    "FK": "Falaknuma",
+    "GW": "Gachibowli",
+    "MP": "Madhapur",
+    "SR": "Secunderabad",
+}
+
 def get_station_name(station_code):
-    station_mapping = {
-       "CH": "Charminar",
-        "PJ": "Panjagutta",
-        "MH": "Mehdipatnam",
-        "ER": "Erragada",
-        "OU": "Osmaina University",
-        "JH": "Jubliee Hills",
-        "BL": "Balapur",
-        "GF": "Golconda Fort",
-        "LB": "LB Nagar",
-        "MK": "Manikonda",
-        "AL": "Alwal",
-        "BH": "Banjara Hills",
-        "AM": "Ameerpet",
-        "SA": "Shamshabad",
-        "AT": "Attapur",
-        "NA": "Narsingi",
-        "FK": "Falaknuma",
-        "GW": "Gachibowli",
-        "MP": "Madhapur",
-        "SR": "Secunderabad",
-    }
-
-    return station_mapping.get(station_code, None)
+    return STATION_CODES.get(station_code, None)
 
 def draw_metro_graph(graph):
+    # Imported here so the booking logic and benchmark run without the plotting dependencies
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     G = nx.Graph()
     for station, connections in graph.vertices.items():
         for neighbor, weight in connections.items():
@@ -219,9 +227,149 @@ def fareCalculator(graph, source, destination):
     if num_stations == 0:
         return f"No path found from {source_name} to {destination_name}."
 
-    fare = 20 + (num_stations - 1) * 5
+    fare = calculate_fare(path_distance)
     return f"FARE FROM {source_name} TO {destination_name} IS {fare} RUPEES"
 
+def calculate_fare(path):
+    return 20 + (len(path) - 1) * 5
+
+def price_legs(graph, legs):
+    # One Dijkstra run per distinct source and one path walk per distinct
+    # (source, destination) pair, however many passengers share the leg.
+    fares = {}
+    distances_by_source = {}
+
+    for source, destination in legs:
+        if (source, destination) in fares:
+            continue
+
+        if source not in distances_by_source:
+            distances_by_source[source] = dijkstra(graph, source)
+        distances = distances_by_source[source]
+
+        if distances.get(destination, float('inf')) == float('inf'):
+            fares[(source, destination)] = None
+        else:
+            path = get_shortest_path_distance(graph, source, destination, distances)
+            fares[(source, destination)] = calculate_fare(path)
+
+    return fares
+
+PASSENGER_CSV_COLUMNS = ("name", "age", "phone", "source_station", "destination_station")
+
+def load_passengers_from_csv(csv_file):
+    # utf-8-sig drops the byte order mark Excel writes at the start of "CSV UTF-8" exports
+    if isinstance(csv_file, str):
+        with open(csv_file, newline="", encoding="utf-8-sig") as handle:
+            return load_passengers_from_csv(handle)
+
+    reader = csv.DictReader(csv_file)
+    if reader.fieldnames:
+        reader.fieldnames = [field.lstrip("\ufeff").strip() for field in reader.fieldnames]
+    missing_columns = [column for column in PASSENGER_CSV_COLUMNS if column not in (reader.fieldnames or [])]
+    if missing_columns:
+        raise ValueError(f"CSV file is missing column(s): {', '.join(missing_columns)}")
+
+    passengers = []
+    for row in reader:
+        passengers.append(Passenger(
+            (row.get("name") or "").strip(),
+            (row.get("age") or "").strip(),
+            (row.get("phone") or "").strip(),
+            (row.get("source_station") or "").strip(),
+            (row.get("destination_station") or "").strip(),
+        ))
+    return passengers
+
+def build_metro_graph(graph):
+    graph.add_vertex("Balapur")
+    graph.add_vertex("Attapur")
+    graph.add_vertex("Mehdipatnam")
+    graph.add_vertex("Gachibowli")
+    graph.add_vertex("Golconda Fort")
+    graph.add_vertex("Madhapur")
+    graph.add_vertex("Ameerpet")
+    graph.add_vertex("Erragada")
+    graph.add_vertex("Shamshabad")
+    graph.add_vertex("Narsingi")
+    graph.add_vertex("Alwal")
+    graph.add_vertex("LB Nagar")
+    graph.add_vertex("Charminar")
+    graph.add_vertex("Manikonda")
+    graph.add_vertex("Falaknuma")
+    graph.add_vertex("Osmaina University")
+    graph.add_vertex("Secunderabad")
+    graph.add_vertex("Jubliee Hills")
+    graph.add_vertex("Panjagutta")
+    graph.add_vertex("Banjara Hills")
+
+    graph.add_edge("Balapur", "Attapur", 8)
+    graph.add_edge("Attapur", "Mehdipatnam", 10)
+    graph.add_edge("Mehdipatnam", "Golconda Fort", 8)
+    graph.add_edge("Mehdipatnam", "Gachibowli", 6)
+    graph.add_edge("Gachibowli", "Madhapur", 9)
+    graph.add_edge("Madhapur", "Ameerpet", 7)
+    graph.add_edge("Ameerpet", "Erragada", 6)
+    graph.add_edge("Shamshabad", "Narsingi", 15)
+    graph.add_edge("Narsingi", "Manikonda", 6)
+    graph.add_edge("Manikonda", "Gachibowli", 7)
+    graph.add_edge("Gachibowli", "Charminar", 1)
+    graph.add_edge("Charminar", "LB Nagar", 2)
+    graph.add_edge("LB Nagar", "Alwal", 5)
+    graph.add_edge("Charminar", "Falaknuma", 2)
+    graph.add_edge("Falaknuma", "Osmaina University", 7)
+    graph.add_edge("Osmaina University", "Secunderabad", 8)
+    graph.add_edge("Madhapur", "Jubliee Hills", 2)
+    graph.add_edge("Banjara Hills", "Jubliee Hills", 2)
+    graph.add_edge("Banjara Hills", "Panjagutta", 3)
+    return graph
+
+def benchmark_bulk_booking(sizes=(1000, 2000, 4000, 8000, 16000, 32000)):
+    graph = build_metro_graph(Graph())
+    codes = list(STATION_CODES)
+    results = []
+
+    for size in sizes:
+        passengers = [
+            Passenger(f"Passenger {i}", str(18 + i % 60), "9000000000",
+                      codes[i % len(codes)], codes[(i * 7 + 3) % len(codes)])
+            for i in range(size)
+        ]
+        booking_system = TicketBookingSystem(total_tickets=size)
+
+        start = time.perf_counter()
+        booking_system.book_bulk(graph, passengers)
+        elapsed = time.perf_counter() - start
+        results.append((size, elapsed))
+
+    return results
+
+
+class BookingReceipt:
+    def __init__(self, booking_id):
+        self.booking_id = booking_id
+        self.tickets = []
+        self.waitlisted = []
+        self.errors = []
+        self.total_fare = 0
+
+    def is_confirmed(self):
+        return not self.errors and not self.waitlisted
+
+    def summary(self):
+        lines = [f"Booking ID: {self.booking_id}"]
+        if self.errors:
+            lines.append("Booking rejected, no seats were allocated:")
+            lines.extend(self.errors)
+            return "\n".join(lines)
+
+        lines.append(f"Tickets confirmed: {len(self.tickets)}")
+        if self.tickets:
+            lines.append(f"Ticket numbers: {self.tickets[0]['ticket_number']} - {self.tickets[-1]['ticket_number']}")
+        lines.append(f"Waitlisted passengers: {len(self.waitlisted)}")
+        lines.append(f"Total fare: {self.total_fare} RUPEES")
+        return "\n".join(lines)
+
 
 class TicketBookingSystem:
     def __init__(self, total_tickets):
@@ -230,36 +378,77 @@ class TicketBookingSystem:
         self.passenger_records = LinkedList()
         self.waitlist = Queue()
         self.passenger_details = {}
+        self.passenger_tickets = {}
+        self.ticket_numbers = itertools.count(1)
+        self.booking_numbers = itertools.count(1)
+
+    def next_ticket_number(self):
+        return f"Ticket {next(self.ticket_numbers)}"
+
+    def issue_ticket(self, passenger, fare=None):
+        ticket_number = self.next_ticket_number()
+        self.add_passenger(passenger)
+        self.passenger_tickets[passenger] = ticket_number
+        self.passenger_details[ticket_number] = {
+            'ticket_number': ticket_number,
+            'passenger': passenger,
+            'passenger_name': passenger.name,
+            'source_station': passenger.source_station,
+            'destination_station': passenger.destination_station,
+            'fare': fare
+        }
+        self.available_tickets -= 1
+        return self.passenger_details[ticket_number]
 
     def book_tickets(self, num_tickets, passengers):
-        if num_tickets <= self.available_tickets:
-            for i in range(num_tickets):
-                passenger = passengers[i]
-                passenger_name = passenger.name
-                self.add_passenger(passenger)
-                ticket_number = f"Ticket {i + 1}"
-                self.passenger_details[passenger_name] = {
-                    'ticket_number': ticket_number,
-                    'source_station': passenger.source_station,
-                    'destination_station': passenger.destination_station
-                }
-            self.available_tickets -= num_tickets
+        num_booked = min(num_tickets, self.available_tickets)
+        for passenger in passengers[:num_booked]:
+            self.issue_ticket(passenger)
+
+        if num_tickets <= num_booked:
             return True, []
-        else:
-            waiting_list = passengers[self.available_tickets:]
-            for i in range(self.available_tickets):
-                passenger = passengers[i]
-                passenger_name = passenger.name
-                self.add_passenger(passenger)
-                ticket_number = f"Ticket {i + 1}"
-                self.passenger_details[passenger_name] = {
-                    'ticket_number': ticket_number,
-                    'source_station': passenger.source_station,
-                    'destination_station': passenger.destination_station
-                }
-            self.available_tickets = 0
-            self.waitlist.enqueue(waiting_list)
-            return False, waiting_list
+
+        waiting_list = passengers[num_booked:]
+        for passenger in waiting_list:
+            self.waitlist.enqueue(passenger)
+        return False, waiting_list
+
+    def book_bulk(self, graph, passengers):
+        passengers = list(passengers)
+        receipt = BookingReceipt(f"Booking {next(self.booking_numbers)}")
+
+        # Validate every record before touching any state so that a bad row
+        # rejects the whole group instead of leaving it half booked.
+        legs = []
+        for index, passenger in enumerate(passengers):
+            source_name = get_station_name(str(passenger.source_station).upper())
+            destination_name = get_station_name(str(passenger.destination_station).upper())
+            if not passenger.name or not str(passenger.name).strip():
+                receipt.errors.append(f"Record {index + 1}: passenger name is missing.")
+            if not source_name or not destination_name:
+                receipt.errors.append(f"Record {index + 1} ({passenger.name}): invalid station code(s).")
+            legs.append((source_name, destination_name))
+
+        if receipt.errors:
+            return receipt
+
+        fares = price_legs(graph, legs)
+        for (source_name, destination_name), fare in fares.items():
+            if fare is None:
+                receipt.errors.append(f"No path found from {source_name} to {destination_name}.")
+
+        if receipt.errors:
+            return receipt
+
+        for passenger, leg in zip(passengers, legs):
+            if self.available_tickets > 0:
+                receipt.tickets.append(self.issue_ticket(passenger, fares[leg]))
+                receipt.total_fare += fares[leg]
+            else:
+                self.waitlist.enqueue(passenger)
+                receipt.waitlisted.append(passenger)
+
+        return receipt
 
     def check_ticket_availability(self):
         return self.available_tickets
@@ -270,19 +459,12 @@ class TicketBookingSystem:
             if current.passenger.name == passenger_name:
                 passenger_age = current.passenger.age
                 passenger_phone = current.passenger.phone
-                ticket_details = self.passenger_details.get(passenger_name, {}).get('ticket_number', '')
+                ticket_details = self.passenger_tickets.get(current.passenger, '')
                 return passenger_name, passenger_age, passenger_phone, ticket_details
             current = current.next
         return "Passenger not found"
     def add_passenger(self, passenger):
-        new_node = ListNode(passenger)
-        if not self.passenger_records.head:
-            self.passenger_records.head = new_node
-        else:
-            current = self.passenger_records.head
-            while current.next:
-                current = current.next
-            current.next = new_node
+        self.passenger_records.add_passenger(passenger)
 
     def process_waiting_list(self, num_tickets):
         passengers_to_book = []
@@ -399,11 +581,11 @@ class BookingHistoryPage(ttk.Frame):
         passenger_details = self.controller.ticket_booking_system.passenger_details
 
         if passenger_details:
-            for passenger_name, details in passenger_details.items():
-                ticket_number = details.get('ticket_number', '')
+            for ticket_number, details in passenger_details.items():
+                passenger_name = details.get('passenger_name', '')
                 source_station = details.get('source_station', '')
                 destination_station = details.get('destination_station', '')
-                fare = fareCalculator(self.controller.metro_graph, source_station, destination_station).split()[-2]  # Extract fare from the fareCalculator result
+                fare = self.get_fare(details)
                 self.tree.insert("", "end", values=(ticket_number, passenger_name, source_station, destination_station, fare))
 
             self.tree.pack(pady=10)
@@ -413,13 +595,13 @@ class BookingHistoryPage(ttk.Frame):
 
         if passenger_details:
             details_text = ""
-            for passenger_name, details in passenger_details.items():
+            for ticket_number, details in passenger_details.items():
                 if isinstance(details, dict):
-                    ticket_number = details.get('ticket_number', '')
+                    passenger = details['passenger']
                     source_station = details.get('source_station', '')
                     destination_station = details.get('destination_station', '')
-                    fare = fareCalculator(self.controller.metro_graph, source_station, destination_station).split()[-2] 
-                    passenger_name, passenger_age, passenger_phone, _ = self.controller.ticket_booking_system.get_passenger_details(passenger_name)
+                    fare = self.get_fare(details)
+                    passenger_name, passenger_age, passenger_phone = passenger.name, passenger.age, passenger.phone
 
                     details_text += f"Ticket Number: {ticket_number}\n"
                     details_text += f"Passenger Name: {passenger_name}\n"
@@ -440,6 +622,11 @@ class BookingHistoryPage(ttk.Frame):
         else:
             messagebox.showinfo("No Tickets", "No tickets to display details.")
 
+    def get_fare(self, details):
+        if details.get('fare') is not None:
+            return details['fare']
+        return fareCalculator(self.controller.metro_graph, details.get('source_station', ''), details.get('destination_station', '')).split()[-2]  # Extract fare from the fareCalculator result
+
     def go_to_start_page(self):
         self.controller.show_frame("StartPage")
 
@@ -488,46 +675,7 @@ class MetroApp(tk.Tk):
         frame.tkraise()
 
     def create_metro_map(self):
-        self.metro_graph.add_vertex("Balapur")
-        self.metro_graph.add_vertex("Attapur")
-        self.metro_graph.add_vertex("Mehdipatnam")
-        self.metro_graph.add_vertex("Gachibowli")
-        self.metro_graph.add_vertex("Golconda Fort")
-        self.metro_graph.add_vertex("Madhapur")
-        self.metro_graph.add_vertex("Ameerpet")
-        self.metro_graph.add_vertex("Erragada")
-        self.metro_graph.add_vertex("Shamshabad")
-        self.metro_graph.add_vertex("Narsingi")
-        self.metro_graph.add_vertex("Alwal")
-        self.metro_graph.add_vertex("LB Nagar")
-        self.metro_graph.add_vertex("Charminar")
-        self.metro_graph.add_vertex("Manikonda")
-        self.metro_graph.add_vertex("Falaknuma")
-        self.metro_graph.add_vertex("Osmaina University")
-        self.metro_graph.add_vertex("Secunderabad")
-        self.metro_graph.add_vertex("Jubliee Hills")
-        self.metro_graph.add_vertex("Panjagutta")
-        self.metro_graph.add_vertex("Banjara Hills")
-
-        self.metro_graph.add_edge("Balapur", "Attapur", 8)
-        self.metro_graph.add_edge("Attapur", "Mehdipatnam", 10)
-        self.metro_graph.add_edge("Mehdipatnam", "Golconda Fort", 8)
-        self.metro_graph.add_edge("Mehdipatnam", "Gachibowli", 6)
-        self.metro_graph.add_edge("Gachibowli", "Madhapur", 9)
-        self.metro_graph.add_edge("Madhapur", "Ameerpet", 7)
-        self.metro_graph.add_edge("Ameerpet", "Erragada", 6)
-        self.metro_graph.add_edge("Shamshabad", "Narsingi", 15)
-        self.metro_graph.add_edge("Narsingi", "Manikonda", 6)
-        self.metro_graph.add_edge("Manikonda", "Gachibowli", 7)
-        self.metro_graph.add_edge("Gachibowli", "Charminar", 1)
-        self.metro_graph.add_edge("Charminar", "LB Nagar", 2)
-        self.metro_graph.add_edge("LB Nagar", "Alwal", 5)
-        self.metro_graph.add_edge("Charminar", "Falaknuma", 2)
-        self.metro_graph.add_edge("Falaknuma", "Osmaina University", 7)
-        self.metro_graph.add_edge("Osmaina University", "Secunderabad", 8)
-        self.metro_graph.add_edge("Madhapur", "Jubliee Hills", 2)
-        self.metro_graph.add_edge("Banjara Hills", "Jubliee Hills", 2)
-        self.metro_graph.add_edge("Banjara Hills", "Panjagutta", 3)
+        build_metro_graph(self.metro_graph)
 
 class StartPage(ttk.Frame):
     def __init__(self, parent, controller):
@@ -563,6 +711,9 @@ class StartPage(ttk.Frame):
         button_check_availability = ttk.Button(options_frame, text="Check seat availability", command=lambda: self.show_options("Check seat availability"))
         button_check_availability.grid(row=2, column=2, padx=10)
 
+        button_bulk_booking = ttk.Button(options_frame, text="Bulk booking (CSV)", command=lambda: self.show_options("Bulk booking (CSV)"))
+        button_bulk_booking.grid(row=3, column=0, padx=10)
+
         button_exit = ttk.Button(options_frame, text="Exit", command=self.controller.quit)
         button_exit.grid(row=3, column=1, pady=10)
 
@@ -612,21 +763,31 @@ class StartPage(ttk.Frame):
                     phone = tk.simpledialog.askstring("Passenger Phone", "Enter passenger phone number:")
                     passengers.append(Passenger(name, age, phone, source_station_code, destination_station_code))
 
-                success, waiting_list = self.controller.ticket_booking_system.book_tickets(num_tickets, passengers)
-                if success:
+                receipt = self.controller.ticket_booking_system.book_bulk(self.controller.metro_graph, passengers)
+                if receipt.errors:
+                    output += "\n".join(receipt.errors) + "\n"
+                elif receipt.is_confirmed():
                     output += "Tickets booked successfully.\n"
                     output += f"TICKETS ARE SENT TO YOUR GIVEN NUMBER\n"
                 else:
                     output += f"Tickets not available. Added to waiting list.\n"
 
-                success, _ = self.controller.ticket_booking_system.process_waiting_list(len(waiting_list))
-                if success:
-                    output += "Waiting list processed successfully.\n"
-
-
             self.text_widget.delete(1.0, tk.END)
             self.text_widget.insert(tk.END, output)
 
+        elif option == "Bulk booking (CSV)":
+            csv_path = filedialog.askopenfilename(title="Select passenger CSV", filetypes=[("CSV files", "*.csv")])
+            if csv_path:
+                try:
+                    passengers = load_passengers_from_csv(csv_path)
+                except (OSError, UnicodeDecodeError, csv.Error, ValueError) as error:
+                    messagebox.showerror("Bulk Booking", f"Could not read {csv_path}:\n{error}")
+                    return
+                receipt = self.controller.ticket_booking_system.book_bulk(self.controller.metro_graph, passengers)
+
+                self.text_widget.delete(1.0, tk.END)
+                self.text_widget.insert(tk.END, receipt.summary())
+
         elif option == "Recent booking history":
             self.controller.show_frame("BookingHistoryPage")
 
@@ -648,5 +809,9 @@ class StartPage(ttk.Frame):
     def go_to_booking_history(self):
         self.controller.show_frame("BookingHistoryPage")
 if __name__ == "__main__":  
-    app = MetroApp()
-    app.mainloop()
+    if "--benchmark" in sys.argv:
+        for size, elapsed in benchmark_bulk_booking():
+            print(f"{size:>6} passengers  {elapsed * 1000:9.2f} ms  {elapsed / size * 1e6:6.2f} us/passenger")
+    else:
+        app = MetroApp()
+        app.mainloop()
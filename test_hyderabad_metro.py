@@ -0,0 +1,108 @@
+import io
+
+import pytest
+
+from Hyderabad_metro import (
+    STATION_CODES,
+    Graph,
+    Passenger,
+    TicketBookingSystem,
+    build_metro_graph,
+    dijkstra,
+    fareCalculator,
+    get_shortest_path_distance,
+    load_passengers_from_csv,
+    price_legs,
+)
+
+
+@pytest.fixture
+def graph():
+    return build_metro_graph(Graph())
+
+
+def make_passenger(name, source="CH", destination="SR"):
+    return Passenger(name, "30", "9000000000", source, destination)
+
+
+def test_invalid_row_rejects_whole_group_without_changing_state(graph):
+    booking_system = TicketBookingSystem(total_tickets=5)
+    passengers = [make_passenger("A"), make_passenger("B", "ZZ", "SR"), make_passenger("")]
+
+    receipt = booking_system.book_bulk(graph, passengers)
+
+    assert len(receipt.errors) == 2
+    assert receipt.tickets == []
+    assert booking_system.available_tickets == 5
+    assert booking_system.passenger_details == {}
+    assert booking_system.passenger_records.head is None
+    assert booking_system.waitlist.is_empty()
+
+
+def test_ticket_numbers_are_unique_across_bookings_and_duplicate_names(graph):
+    booking_system = TicketBookingSystem(total_tickets=10)
+
+    first = booking_system.book_bulk(graph, [make_passenger("Ravi"), make_passenger("Ravi")])
+    second = booking_system.book_bulk(graph, [make_passenger("Ravi", "BL", "PJ")])
+
+    ticket_numbers = [ticket['ticket_number'] for ticket in first.tickets + second.tickets]
+    assert ticket_numbers == ["Ticket 1", "Ticket 2", "Ticket 3"]
+    assert len(booking_system.passenger_details) == 3
+    assert first.booking_id != second.booking_id
+
+
+def test_passengers_beyond_capacity_are_waitlisted(graph):
+    booking_system = TicketBookingSystem(total_tickets=3)
+    passengers = [make_passenger(f"P{i}") for i in range(5)]
+
+    receipt = booking_system.book_bulk(graph, passengers)
+
+    assert len(receipt.tickets) == 3
+    assert receipt.waitlisted == passengers[3:]
+    assert not receipt.is_confirmed()
+    assert booking_system.available_tickets == 0
+    assert booking_system.waitlist.dequeue() is passengers[3]
+    assert booking_system.waitlist.dequeue() is passengers[4]
+
+
+def test_price_legs_matches_fare_calculator_for_every_pair(graph):
+    legs = [(source, destination) for source in STATION_CODES.values() for destination in STATION_CODES.values()]
+    names_to_codes = {name: code for code, name in STATION_CODES.items()}
+
+    fares = price_legs(graph, legs)
+
+    for (source, destination), fare in fares.items():
+        expected = fareCalculator(graph, names_to_codes[source], names_to_codes[destination]).split()[-2]
+        assert str(fare) == expected
+
+
+def test_shortest_path_follows_edges_and_matches_dijkstra_distance(graph):
+    for source in graph.vertices:
+        distances = dijkstra(graph, source)
+        for destination in graph.vertices:
+            path = get_shortest_path_distance(graph, source, destination)
+            assert path[0] == source and path[-1] == destination
+            length = sum(graph.vertices[a][b] for a, b in zip(path, path[1:]))
+            assert length == distances[destination]
+
+
+def test_load_passengers_from_csv_strips_byte_order_mark(tmp_path):
+    csv_path = tmp_path / "group.csv"
+    csv_path.write_bytes(b"\xef\xbb\xbfname,age,phone,source_station,destination_station\r\nAsha,12,99,CH,SR\r\n")
+
+    passengers = load_passengers_from_csv(str(csv_path))
+
+    assert [passenger.name for passenger in passengers] == ["Asha"]
+    assert passengers[0].source_station == "CH"
+
+
+def test_load_passengers_from_csv_rejects_missing_columns():
+    with pytest.raises(ValueError, match="name"):
+        load_passengers_from_csv(io.StringIO("full_name,age,phone,source_station,destination_station\nAsha,12,99,CH,SR\n"))
+
+
+def test_get_passenger_details_returns_ticket_number(graph):
+    booking_system = TicketBookingSystem(total_tickets=5)
+    booking_system.book_bulk(graph, [make_passenger("Asha"), make_passenger("Ravi")])
+
+    assert booking_system.get_passenger_details("Ravi") == ("Ravi", "30", "9000000000", "Ticket 2")